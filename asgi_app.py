@@ -0,0 +1,132 @@
+"""
+ASGI entry point for Produsum AI
+
+Serves the Socket.IO layer from python-socketio's AsyncServer on a single
+event loop, with the Flask routes from web.py mounted behind it. This module
+never imports app.py, so no eventlet server is built in the asyncio process.
+
+Run with:
+    uvicorn asgi_app:app --host 0.0.0.0 --port 3000
+
+Keep to a single worker process: Socket.IO polling needs every request of a
+session to reach the same process, which multiple workers only allow with
+sticky sessions or a message queue.
+"""
+import asyncio
+import logging
+from typing import Dict, Any, Set
+
+import socketio
+from asgiref.wsgi import WsgiToAsgi
+
+from config import AppConfig
+from web import (
+    app as flask_app,
+    SOCKETIO_OPTIONS,
+    UNEXPECTED_ERROR_MESSAGE,
+    CONNECTED_STATUS,
+    IMAGE_STARTED_UPDATE,
+    error_payload,
+    image_pending_update,
+    prepare_generation,
+    prepare_image_regeneration
+)
+from utils.ai_service import agenerate_product_description, agenerate_product_image
+
+logger = logging.getLogger(__name__)
+
+# Set up the async Socket.IO server with the same settings as app.py
+sio = socketio.AsyncServer(async_mode='asgi', **SOCKETIO_OPTIONS)
+
+# Socket.IO traffic is handled here, everything else goes to Flask
+app = socketio.ASGIApp(sio, other_asgi_app=WsgiToAsgi(flask_app))
+
+# Running image jobs; the event loop only keeps weak references to tasks
+_image_tasks: Set["asyncio.Task[None]"] = set()
+
+def _start_image_task(sid: str, product_name: str) -> None:
+    """Generate an image on the event loop, forwarding its updates to one client"""
+    async def image_callback(update: Dict[str, Any]) -> None:
+        await sio.emit("image_progress", update, to=sid)
+
+    task = asyncio.create_task(
+        agenerate_product_image(product_name, image_callback, model=AppConfig.DEFAULT_IMAGE_MODEL)
+    )
+    _image_tasks.add(task)
+    task.add_done_callback(_image_tasks.discard)
+
+async def _emit_error(sid: str, event: str, message: str, **extra: Any) -> None:
+    """Emit an error update to one client"""
+    await sio.emit(event, error_payload(event, message, **extra), to=sid)
+
+@sio.on("start_generation")
+async def handle_generation(sid: str, data: Dict[str, Any]):
+    """
+    Receives form data from client, validates it, and starts the generation process
+
+    Async counterpart of app.handle_generation; the OpenAI stream is read with
+    the SDK's async API, so no thread is held while this coroutine awaits it.
+    """
+    try:
+        error_update, product_name, image_toggle = prepare_generation(sid, data)
+        if error_update is not None:
+            await sio.emit("progress", error_update, to=sid)
+            return
+
+        # Start image generation immediately if toggled on
+        if image_toggle:
+            await sio.emit("progress", IMAGE_STARTED_UPDATE, to=sid)
+            _start_image_task(sid, product_name)
+
+        completed_text = None
+        # Stream text generation updates without blocking the event loop
+        async for progress_update in agenerate_product_description(
+            data,
+            model=AppConfig.DEFAULT_MODEL,
+            use_cache=AppConfig.ENABLE_CACHING
+        ):
+            # Forward progress updates to the client
+            await sio.emit("progress", progress_update, to=sid)
+
+            if progress_update.get("data") == "Text generation complete.":
+                completed_text = progress_update.get("partial", "")
+
+        # Let the client know the image is still on its way once the text is done
+        if image_toggle and completed_text is not None:
+            await sio.emit("progress", image_pending_update(completed_text), to=sid)
+
+    except Exception as e:
+        # Handle unexpected errors
+        logger.error(f"Unexpected error in handle_generation: {str(e)}", exc_info=True)
+        await _emit_error(sid, "progress", UNEXPECTED_ERROR_MESSAGE, details=str(e))
+
+@sio.on("connect")
+async def handle_connect(sid: str, environ: Dict[str, Any]):
+    """Handle client connection"""
+    logger.debug(f"Client connected: {sid}")
+
+    # Send initial connection status to client
+    await sio.emit("connection_status", CONNECTED_STATUS, to=sid)
+
+@sio.on("disconnect")
+async def handle_disconnect(sid: str):
+    """Handle client disconnection"""
+    logger.debug(f"Client disconnected: {sid}")
+
+@sio.on("regenerate_image")
+async def handle_regenerate_image(sid: str, data: Dict[str, Any]):
+    """
+    Receives product name from client and regenerates just the image
+    """
+    try:
+        error_update, product_name = prepare_image_regeneration(sid, data)
+        if error_update is not None:
+            await sio.emit("image_progress", error_update, to=sid)
+            return
+
+        _start_image_task(sid, product_name)
+
+    except Exception as e:
+        # Handle unexpected errors
+        logger.error(f"Unexpected error in handle_regenerate_image: {str(e)}", exc_info=True)
+        await _emit_error(sid, "image_progress", UNEXPECTED_ERROR_MESSAGE, details=str(e))
@@ -29,6 +29,11 @@ class Config:
     
     # Cache settings
     CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_TIMEOUT", 3600))  # 1 hour
+    CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", 1000))  # Entries before LRU eviction
+    
+    # Worker pools for blocking OpenAI calls (concurrent generations)
+    AI_MAX_WORKERS = int(os.getenv("AI_MAX_WORKERS", 64))
+    IMAGE_MAX_WORKERS = int(os.getenv("IMAGE_MAX_WORKERS", 16))
     
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
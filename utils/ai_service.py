@@ -1,24 +1,10 @@
 import os
 import time
+import queue
 import threading
 import logging
-from typing import Dict, Any, Optional, List, Callable, Generator
-
-try:
-    # Import our compatibility layer instead of directly using OpenAI
-    from .openai_compatibility import (
-        create_chat_completion,
-        create_image,
-        extract_stream_content,
-        get_image_url,
-        IS_NEW_API,
-        OPENAI_AVAILABLE
-    )
-    if not OPENAI_AVAILABLE:
-        print("ERROR: OpenAI module not found. Please install with: pip install openai")
-except ImportError as e:
-    print(f"ERROR: Failed to import OpenAI compatibility layer: {e}")
-    OPENAI_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, Generator, AsyncGenerator
 
 from .cache import cache
 from .validation import sanitize_prompt_input
@@ -26,7 +12,96 @@ from .error_handler import handle_openai_error
 
 logger = logging.getLogger(__name__)
 
-# Track usage stats
+# OpenAI compatibility layer, imported on first use so the SDK is only loaded
+# by processes that actually generate content
+_openai = None
+
+def _get_openai() -> Any:
+    """Import the OpenAI compatibility layer on first call and memoize it"""
+    global _openai
+    if _openai is None:
+        # Import our compatibility layer instead of directly using OpenAI
+        from . import openai_compatibility
+        if not openai_compatibility.OPENAI_AVAILABLE:
+            logger.error("OpenAI module not found. Please install with: pip install openai")
+        _openai = openai_compatibility
+    return _openai
+
+# Worker pools for blocking OpenAI calls. Each text stream holds a worker for
+# the whole call, so that pool is sized for the expected number of concurrent
+# generations; image jobs get their own pool so they cannot starve the streams
+DEFAULT_MAX_WORKERS = 64
+DEFAULT_IMAGE_WORKERS = 16
+_executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="ai-worker")
+_image_executor = ThreadPoolExecutor(max_workers=DEFAULT_IMAGE_WORKERS, thread_name_prefix="ai-image")
+
+def configure_workers(max_workers: int, image_workers: int = DEFAULT_IMAGE_WORKERS) -> None:
+    """
+    Replace the text and image worker pools with ones of the given sizes
+    
+    Meant to be called once at startup; jobs already submitted to the old
+    pools keep running there.
+    """
+    global _executor, _image_executor
+    old_executors = (_executor, _image_executor)
+    _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-worker")
+    _image_executor = ThreadPoolExecutor(max_workers=image_workers, thread_name_prefix="ai-image")
+    for old_executor in old_executors:
+        old_executor.shutdown(wait=False)
+
+# Marks the end of a generator bridged through run_generator_in_executor
+STREAM_END = object()
+
+# Batch streamed tokens into one progress update per this many tokens or seconds
+STREAM_FLUSH_TOKENS = 16
+STREAM_FLUSH_INTERVAL = 0.05
+
+# How long a worker waits for the consumer before abandoning a stream
+STREAM_PUT_TIMEOUT = 30
+
+# Static prompt pieces, built once at import time
+_SYSTEM_MESSAGE = (
+    "You are an advanced marketing copywriter assistant specializing in compelling product descriptions. "
+    "Follow the user instructions precisely and format your response into labeled sections. "
+    "Ensure the Body section always has at least one substantial paragraph with engaging content. "
+    "Use persuasive language and focus on benefits rather than just features."
+)
+
+_INSTRUCTIONS_BASE = (
+    "Write a compelling product description with these labeled sections:\n"
+    "Hook: (A short, attention-grabbing opening line)\n"
+    "Body: (At least one full paragraph describing benefits and features)\n"
+    "CTA: (A clear call-to-action)\n\n"
+    "Then provide a line labeled 'Suggested Hashtags and Keywords:' at the end. "
+    "Make sure each section is clearly marked."
+)
+
+_VIRAL_LINE = "Include emotional triggers, social proof, and FOMO for a viral effect."
+_BALANCED_LINE = "Avoid explicit FOMO or hype; keep it persuasive yet balanced."
+
+# First update of a description that is not served from cache
+_GENERATING_UPDATE = {"data": "Generating product description...", "partial": ""}
+
+# Optional form fields included in the prompt, in order, with their labels
+_PROMPT_FIELDS = (
+    ("product_details", "Product Details"),
+    ("language", "Language"),
+    ("tone", "Tone"),
+    ("keywords", "SEO Keywords"),
+    ("audience", "Target Audience"),
+    ("platform", "Platform"),
+    ("usps", "Unique Selling Points"),
+    ("cta_style", "CTA Style"),
+)
+
+# Defaults for fields the client may omit
+_FIELD_DEFAULTS = {
+    "language": "English",
+    "tone": "Professional",
+}
+
+# Track usage stats (shared by worker threads, so guarded by a lock)
+_usage_lock = threading.Lock()
 usage_stats = {
     "total_requests": 0,
     "total_tokens": 0,
@@ -34,154 +109,254 @@ usage_stats = {
     "last_reset": time.time()
 }
 
+def _bump_usage(name: str, amount: int = 1) -> None:
+    """Atomically add amount to one of the usage counters"""
+    with _usage_lock:
+        usage_stats[name] += amount
+
 def reset_usage_stats() -> None:
     """Reset the usage statistics"""
-    global usage_stats
-    usage_stats = {
-        "total_requests": 0,
-        "total_tokens": 0,
-        "total_images": 0,
-        "last_reset": time.time()
-    }
+    with _usage_lock:
+        usage_stats.update({
+            "total_requests": 0,
+            "total_tokens": 0,
+            "total_images": 0,
+            "last_reset": time.time()
+        })
 
 def get_usage_stats() -> Dict[str, Any]:
-    """Get the current usage statistics"""
-    return usage_stats
+    """Get a snapshot of the current usage statistics"""
+    with _usage_lock:
+        return dict(usage_stats)
 
-def generate_product_description(
-    product_info: Dict[str, Any],
-    model: str = "gpt-4",
-    max_tokens: int = 600,
-    temperature: float = 0.7,
-    stream_callback: Optional[Callable[[str], None]] = None,
-    use_cache: bool = True
-) -> Generator[Dict[str, Any], None, None]:
+def run_generator_in_executor(
+    gen_fn: Callable[..., Generator[Any, None, None]],
+    *args,
+    start_background_task: Optional[Callable[..., Any]] = None,
+    **kwargs
+) -> "queue.Queue[Any]":
     """
-    Generate a product description using OpenAI
+    Run a blocking generator in the background and bridge its items into a queue
+    
+    The worker pushes every yielded item, then STREAM_END. If the generator raises,
+    the exception object is pushed before STREAM_END so the consumer can re-raise it.
+    If the consumer stops draining for STREAM_PUT_TIMEOUT seconds, the worker closes
+    the generator and exits instead of blocking forever.
     
     Args:
-        product_info: Dictionary containing product details
-        model: The OpenAI model to use
-        max_tokens: Maximum tokens to generate
-        temperature: Temperature for generation (0.0-1.0)
-        stream_callback: Optional callback for streaming responses
-        use_cache: Whether to use caching
+        gen_fn: Generator function to run
+        *args: Positional arguments for gen_fn
+        start_background_task: Spawner for the worker, e.g. socketio.start_background_task
+            so it runs on the server's async mode (defaults to the shared worker pool)
+        **kwargs: Keyword arguments for gen_fn
         
-    Yields:
-        Dictionary with generation progress updates
+    Returns:
+        Bounded queue receiving the generator's items
+    """
+    items: "queue.Queue[Any]" = queue.Queue(maxsize=4)
+    
+    def _put(item: Any) -> bool:
+        try:
+            items.put(item, timeout=STREAM_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            logger.warning("Consumer stopped draining generator queue, abandoning stream")
+            return False
+    
+    def _pump():
+        gen = gen_fn(*args, **kwargs)
+        try:
+            for item in gen:
+                if not _put(item):
+                    gen.close()
+                    return
+        except Exception as e:
+            if not _put(e):
+                return
+        _put(STREAM_END)
+    
+    if start_background_task is not None:
+        start_background_task(_pump)
+    else:
+        _executor.submit(_pump)
+    return items
+
+class _DeltaBatcher:
+    """Collect streamed deltas and batch them into progress updates"""
+    
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.total_tokens = 0
+        self._pending_tokens = 0
+        self._last_flush = time.monotonic()
+        
+    def add(self, delta: str) -> Optional[Dict[str, Any]]:
+        """
+        Record one delta
+        
+        Returns:
+            A progress update once enough tokens or time have accumulated, else None
+        """
+        self.chunks.append(delta)
+        self.total_tokens += 1
+        self._pending_tokens += 1
+        
+        now = time.monotonic()
+        if self._pending_tokens < STREAM_FLUSH_TOKENS and now - self._last_flush <= STREAM_FLUSH_INTERVAL:
+            return None
+        self._pending_tokens = 0
+        self._last_flush = now
+        # Calculate progress
+        percent = min(100, int((self.total_tokens / 300) * 100))
+        return {
+            "data": "Generating description...",
+            "partial": "".join(self.chunks),
+            "percent": percent
+        }
+        
+    def text(self) -> str:
+        """Return all text received so far"""
+        return "".join(self.chunks)
+
+def _prepare_description(product_info: Dict[str, Any], model: str, use_cache: bool) -> Tuple[str, Optional[str], List[Dict[str, str]]]:
     """
-    global usage_stats
+    Sanitize the form fields and build the chat messages for a description
     
+    Returns:
+        Tuple[str, Optional[str], List[Dict[str, str]]]: (product_name, cache_key, messages);
+        cache_key is None when caching is disabled
+    """
     # Clean and sanitize inputs
     product_name = sanitize_prompt_input(product_info.get("product_name", ""))
-    product_details = sanitize_prompt_input(product_info.get("product_details", ""))
-    language = sanitize_prompt_input(product_info.get("language", "English"))
-    tone = sanitize_prompt_input(product_info.get("tone", "Professional"))
-    keywords = sanitize_prompt_input(product_info.get("keywords", ""))
-    audience = sanitize_prompt_input(product_info.get("audience", ""))
-    platform = sanitize_prompt_input(product_info.get("platform", ""))
-    usps = sanitize_prompt_input(product_info.get("usps", ""))
-    cta_style = sanitize_prompt_input(product_info.get("cta_style", ""))
+    fields = {
+        key: sanitize_prompt_input(product_info.get(key, _FIELD_DEFAULTS.get(key, "")))
+        for key, _ in _PROMPT_FIELDS
+    }
     viral_flag = product_info.get("viral") == "Yes"
     extra_instructions = sanitize_prompt_input(product_info.get("extra_instructions", ""))
     
-    # Check cache if enabled
+    cache_key = None
     if use_cache:
         cache_key = cache.create_key(
             "product_description",
             product_name=product_name,
-            product_details=product_details,
-            language=language,
-            tone=tone,
-            keywords=keywords,
-            audience=audience,
-            platform=platform,
-            usps=usps,
-            cta_style=cta_style,
             viral_flag=viral_flag,
             extra_instructions=extra_instructions,
-            model=model
+            model=model,
+            **fields
         )
-        
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            logger.info(f"Using cached description for '{product_name}'")
-            yield {
-                "data": "Using cached result...",
-                "partial": "",
-                "percent": 50
-            }
-            yield {
-                "data": "Text generation complete.",
-                "partial": cached_result,
-                "percent": 100
-            }
-            return
     
     # Build prompt
-    system_message = (
-        "You are an advanced marketing copywriter assistant specializing in compelling product descriptions. "
-        "Follow the user instructions precisely and format your response into labeled sections. "
-        "Ensure the Body section always has at least one substantial paragraph with engaging content. "
-        "Use persuasive language and focus on benefits rather than just features."
-    )
-    
-    prompt_lines = []
-    prompt_lines.append(f"Product Name: {product_name}")
-    
-    if product_details:
-        prompt_lines.append(f"Product Details: {product_details}")
-    if language:
-        prompt_lines.append(f"Language: {language}")
-    if tone:
-        prompt_lines.append(f"Tone: {tone}")
-    if keywords:
-        prompt_lines.append(f"SEO Keywords: {keywords}")
-    if audience:
-        prompt_lines.append(f"Target Audience: {audience}")
-    if platform:
-        prompt_lines.append(f"Platform: {platform}")
-    if usps:
-        prompt_lines.append(f"Unique Selling Points: {usps}")
-    if cta_style:
-        prompt_lines.append(f"CTA Style: {cta_style}")
-        
-    if viral_flag:
-        prompt_lines.append("Include emotional triggers, social proof, and FOMO for a viral effect.")
-    else:
-        prompt_lines.append("Avoid explicit FOMO or hype; keep it persuasive yet balanced.")
-
-    instructions = (
-        "Write a compelling product description with these labeled sections:\n"
-        "Hook: (A short, attention-grabbing opening line)\n"
-        "Body: (At least one full paragraph describing benefits and features)\n"
-        "CTA: (A clear call-to-action)\n\n"
-        "Then provide a line labeled 'Suggested Hashtags and Keywords:' at the end. "
-        "Make sure each section is clearly marked."
-    )
+    prompt_lines = [f"Product Name: {product_name}"]
+    prompt_lines.extend([f"{label}: {value}" for key, label in _PROMPT_FIELDS if (value := fields[key])])
+    prompt_lines.append(_VIRAL_LINE if viral_flag else _BALANCED_LINE)
     
+    instructions = _INSTRUCTIONS_BASE
     if extra_instructions.strip():
         instructions += f"\nAdditional instructions:\n{extra_instructions.strip()}"
 
     prompt_context = "\n".join(prompt_lines)
     final_prompt = f"{prompt_context}\n\n{instructions}"
+    
+    # Create messages array for API call
+    messages = [
+        {"role": "system", "content": _SYSTEM_MESSAGE},
+        {"role": "user", "content": final_prompt}
+    ]
+    return product_name, cache_key, messages
+
+def _cached_description_updates(product_name: str, cache_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """Return the updates replaying a cached description, or None on a cache miss"""
+    if cache_key is None:
+        return None
+    cached_result = cache.get(cache_key)
+    if not cached_result:
+        return None
+    logger.info(f"Using cached description for '{product_name}'")
+    return [
+        {
+            "data": "Using cached result...",
+            "partial": "",
+            "percent": 50
+        },
+        {
+            "data": "Text generation complete.",
+            "partial": cached_result,
+            "percent": 100
+        }
+    ]
+
+def _complete_description(cache_key: Optional[str], batcher: _DeltaBatcher) -> Dict[str, Any]:
+    """Record usage, cache the finished text and build the completion update"""
+    output_text = batcher.text()
+    
+    # Update token usage stats
+    _bump_usage("total_tokens", batcher.total_tokens)
+    
+    # Store in cache if successful
+    if cache_key is not None:
+        cache.set(cache_key, output_text)
+        
+    # Text generation complete (also flushes any tokens still pending)
+    return {
+        "data": "Text generation complete.",
+        "partial": output_text,
+        "percent": 100
+    }
+
+def _description_error_update(e: Exception, batcher: _DeltaBatcher) -> Dict[str, Any]:
+    """Log a failed description and build the error update"""
+    error_msg, error_details = handle_openai_error(e)
+    logger.error(f"Error generating description: {error_msg}", exc_info=True)
+    return {
+        "data": f"Error: {error_msg}",
+        "partial": batcher.text(),
+        "percent": 0,
+        "error": True,
+        "error_details": error_details._asdict()
+    }
+
+def generate_product_description(
+    product_info: Dict[str, Any],
+    model: str = "gpt-4",
+    max_tokens: int = 600,
+    temperature: float = 0.7,
+    stream_callback: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Generate a product description using OpenAI
+    
+    Args:
+        product_info: Dictionary containing product details
+        model: The OpenAI model to use
+        max_tokens: Maximum tokens to generate
+        temperature: Temperature for generation (0.0-1.0)
+        stream_callback: Optional callback for streaming responses
+        use_cache: Whether to use caching
+        
+    Yields:
+        Dictionary with generation progress updates
+    """
+    product_name, cache_key, messages = _prepare_description(product_info, model, use_cache)
+    
+    # Check cache if enabled
+    cached_updates = _cached_description_updates(product_name, cache_key)
+    if cached_updates is not None:
+        yield from cached_updates
+        return
 
     # Track request
-    usage_stats["total_requests"] += 1
+    _bump_usage("total_requests")
     
-    # Generate the text
-    output_text = ""
+    # Generate the text, collecting deltas and joining them only when needed
+    batcher = _DeltaBatcher()
     try:
-        yield {"data": "Generating product description...", "partial": ""}
-        
-        # Create messages array for API call
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": final_prompt}
-        ]
+        yield dict(_GENERATING_UPDATE)
         
         # Use our compatibility wrapper instead of direct API call
-        response = create_chat_completion(
+        openai_api = _get_openai()
+        response = openai_api.create_chat_completion(
             model=model,
             messages=messages,
             max_tokens=max_tokens,
@@ -189,60 +364,144 @@ def generate_product_description(
             stream=True
         )
 
-        # Stream partial tokens
-        total_tokens = 0
-        
+        # Stream partial tokens, batching deltas so each update carries several tokens
         for chunk in response:
             # Use compatibility function to extract content from chunk
-            delta = extract_stream_content(chunk)
+            delta = openai_api.extract_stream_content(chunk)
             
             if delta:
-                output_text += delta
-                total_tokens += 1
-                # Calculate progress
-                percent = min(100, int((total_tokens / 300) * 100))
-                yield {
-                    "data": "Generating description...",
-                    "partial": output_text,
-                    "percent": percent
-                }
+                update = batcher.add(delta)
                 
                 # Call stream callback if provided
                 if stream_callback:
                     stream_callback(delta)
+                
+                if update is not None:
+                    yield update
+        
+        yield _complete_description(cache_key, batcher)
         
-        # Update token usage stats
-        usage_stats["total_tokens"] += total_tokens
+    except Exception as e:
+        yield _description_error_update(e, batcher)
+
+async def agenerate_product_description(
+    product_info: Dict[str, Any],
+    model: str = "gpt-4",
+    max_tokens: int = 600,
+    temperature: float = 0.7,
+    stream_callback: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Generate a product description using OpenAI's async API
+    
+    Async counterpart of generate_product_description for asyncio servers: the
+    completion is streamed on the event loop, so no thread is held per client.
+    Takes the same arguments and yields the same progress updates.
+    """
+    product_name, cache_key, messages = _prepare_description(product_info, model, use_cache)
+    
+    # Check cache if enabled
+    cached_updates = _cached_description_updates(product_name, cache_key)
+    if cached_updates is not None:
+        for update in cached_updates:
+            yield update
+        return
+
+    # Track request
+    _bump_usage("total_requests")
+    
+    batcher = _DeltaBatcher()
+    try:
+        yield dict(_GENERATING_UPDATE)
         
-        # Store in cache if successful
-        if use_cache:
-            cache.set(cache_key, output_text)
+        openai_api = _get_openai()
+        response = await openai_api.acreate_chat_completion(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+
+        async for chunk in response:
+            delta = openai_api.extract_stream_content(chunk)
             
-        # Text generation complete
-        yield {
-            "data": "Text generation complete.",
-            "partial": output_text,
-            "percent": 100
-        }
+            if delta:
+                update = batcher.add(delta)
+                
+                # Call stream callback if provided
+                if stream_callback:
+                    stream_callback(delta)
+                
+                if update is not None:
+                    yield update
+        
+        yield _complete_description(cache_key, batcher)
         
     except Exception as e:
-        error_msg, error_details = handle_openai_error(e)
-        logger.error(f"Error generating description: {error_msg}", exc_info=True)
-        yield {
-            "data": f"Error: {error_msg}",
-            "partial": output_text if output_text else "",
-            "percent": 0,
-            "error": True,
-            "error_details": error_details
-        }
+        yield _description_error_update(e, batcher)
+
+# Progress updates sent before the image request goes out
+_IMAGE_PROGRESS_STEPS = (
+    # Step 1: Creating image prompt
+    {"status": "Creating image prompt...", "percent": 10},
+    # Step 2: Sending to DALL-E
+    {"status": "Sending request to DALL-E 3...", "percent": 25},
+    # Step 3: Generate the image
+    {"status": "Your image is being generated, it can take up to 30 seconds...", "percent": 50},
+)
+
+def _prepare_image(product_name: str, model: str, size: str, quality: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Sanitize the product name and look up a cached image
+    
+    Returns:
+        Tuple[str, str, Optional[str]]: (sanitized_product_name, cache_key, cached_url)
+    """
+    sanitized_product_name = sanitize_prompt_input(product_name)
+    cache_key = cache.create_key(
+        "product_image",
+        product_name=sanitized_product_name,
+        model=model,
+        size=size,
+        quality=quality
+    )
+    cached_result = cache.get(cache_key)
+    if cached_result:
+        logger.info(f"Using cached image for '{sanitized_product_name}'")
+    return sanitized_product_name, cache_key, cached_result
+
+def _image_prompt(sanitized_product_name: str) -> str:
+    """Build the DALL-E prompt for a product"""
+    return f"Generate a realistic, high-quality image of the product: {sanitized_product_name}. Do not include any text, logos, or branding."
+
+def _image_done_update(image_url: str) -> Dict[str, Any]:
+    """Build the final image update (only the URL and percent, no status message)"""
+    return {
+        "percent": 100,
+        "image_url": image_url
+    }
+
+def _image_error_update(e: Exception) -> Dict[str, Any]:
+    """Log a failed image job and build the error update"""
+    error_msg, error_details = handle_openai_error(e)
+    logger.error(f"Image generation error: {error_msg}", exc_info=True)
+    return {
+        "status": f"Image generation failed: {error_msg}",
+        "percent": 100,
+        "error": True,
+        "error_details": error_details._asdict()
+    }
 
 def generate_product_image_async(
     product_name: str,
     callback: Callable[[Dict[str, Any]], None],
     model: str = "dall-e-3",
     size: str = "1024x1024",
-    quality: str = "standard"
-) -> None:
+    quality: str = "standard",
+    start_background_task: Optional[Callable[..., Any]] = None
+) -> Optional[Any]:
     """
     Generate a product image asynchronously with DALL-E
     
@@ -252,104 +511,93 @@ def generate_product_image_async(
         model: The DALL-E model to use
         size: Image size
         quality: Image quality
+        start_background_task: Spawner for the worker, e.g. socketio.start_background_task
+            so it runs on the server's async mode (defaults to the image worker pool)
+        
+    Returns:
+        Handle for the background image job, or None if served from cache
     """
-    # Make a local copy of all parameters to prevent scoping issues
-    local_product_name = product_name
-    local_callback = callback
-    local_model = model
-    local_size = size
-    local_quality = quality
+    # Clean input and check the cache before starting any background work
+    sanitized_product_name, cache_key, cached_result = _prepare_image(product_name, model, size, quality)
+    if cached_result:
+        callback(_image_done_update(cached_result))
+        return None
     
     def _generate_image():
-        global usage_stats
-        
         try:
-            # Clean input
-            sanitized_product_name = sanitize_prompt_input(local_product_name)
-            
-            # Step 1: Creating image prompt
-            local_callback({
-                "status": "Creating image prompt...",
-                "percent": 10
-            })
-            
-            # Check cache
-            cache_key = cache.create_key(
-                "product_image",
-                product_name=sanitized_product_name,
-                model=local_model,
-                size=local_size,
-                quality=local_quality
-            )
-            
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Using cached image for '{sanitized_product_name}'")
-                local_callback({
-                    "status": "Using cached image...",
-                    "percent": 50
-                })
-                # Send image URL without success message
-                local_callback({
-                    "percent": 100,
-                    "image_url": cached_result
-                })
-                return
-            
-            # Create the image prompt
-            image_prompt = f"Generate a realistic, high-quality image of the product: {sanitized_product_name}. Do not include any text, logos, or branding."
-            
-            # Step 2: Sending to DALL-E
-            local_callback({
-                "status": "Sending request to DALL-E 3...",
-                "percent": 25
-            })
-            
-            # Step 3: Generate the image
-            local_callback({
-                "status": "Your image is being generated, it can take up to 30 seconds...",
-                "percent": 50
-            })
+            for step in _IMAGE_PROGRESS_STEPS:
+                callback(dict(step))
             
             # Track image generation
-            usage_stats["total_images"] += 1
-            usage_stats["total_requests"] += 1
+            _bump_usage("total_images")
+            _bump_usage("total_requests")
             
             # Generate the image using compatibility wrapper
-            image_response = create_image(
-                prompt=image_prompt,
+            openai_api = _get_openai()
+            image_response = openai_api.create_image(
+                prompt=_image_prompt(sanitized_product_name),
                 n=1,
-                size=local_size,
-                model=local_model,
-                quality=local_quality
+                size=size,
+                model=model,
+                quality=quality
             )
             
             # Get image URL using compatibility function
-            image_url = get_image_url(image_response)
+            image_url = openai_api.get_image_url(image_response)
             
             # Cache the result
             cache.set(cache_key, image_url)
             
-            # Send only the URL and percent without status message
-            local_callback({
-                "percent": 100,
-                "image_url": image_url
-            })
+            callback(_image_done_update(image_url))
             
         except Exception as e:
-            error_msg, error_details = handle_openai_error(e)
-            logger.error(f"Image generation error: {error_msg}", exc_info=True)
-            
-            local_callback({
-                "status": f"Image generation failed: {error_msg}",
-                "percent": 100,
-                "error": True,
-                "error_details": error_details
-            })
+            callback(_image_error_update(e))
     
-    # Run in background thread to avoid blocking
-    thread = threading.Thread(target=_generate_image)
-    thread.daemon = True
-    thread.start()
+    # Run in the background to avoid blocking
+    if start_background_task is not None:
+        return start_background_task(_generate_image)
+    return _image_executor.submit(_generate_image)
+
+async def agenerate_product_image(
+    product_name: str,
+    callback: Callable[[Dict[str, Any]], Awaitable[None]],
+    model: str = "dall-e-3",
+    size: str = "1024x1024",
+    quality: str = "standard"
+) -> None:
+    """
+    Generate a product image with DALL-E's async API
     
-    return thread 
\ No newline at end of file
+    Async counterpart of generate_product_image_async, meant to be scheduled
+    with asyncio.create_task. The callback is awaited for every update.
+    """
+    sanitized_product_name, cache_key, cached_result = _prepare_image(product_name, model, size, quality)
+    if cached_result:
+        await callback(_image_done_update(cached_result))
+        return
+    
+    try:
+        for step in _IMAGE_PROGRESS_STEPS:
+            await callback(dict(step))
+        
+        # Track image generation
+        _bump_usage("total_images")
+        _bump_usage("total_requests")
+        
+        openai_api = _get_openai()
+        image_response = await openai_api.acreate_image(
+            prompt=_image_prompt(sanitized_product_name),
+            n=1,
+            size=size,
+            model=model,
+            quality=quality
+        )
+        image_url = openai_api.get_image_url(image_response)
+        
+        # Cache the result
+        cache.set(cache_key, image_url)
+        
+        await callback(_image_done_update(image_url))
+        
+    except Exception as e:
+        await callback(_image_error_update(e))
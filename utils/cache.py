@@ -1,22 +1,60 @@
 import time
-from typing import Dict, Any, Optional, Tuple
+import heapq
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, List
 
 class SimpleCache:
     """
-    A simple in-memory cache for API responses
+    A simple in-memory LRU cache for API responses
     
-    This reduces redundant API calls by storing results with an expiration time
+    This reduces redundant API calls by storing results with an expiration time.
+    The cache is bounded to max_size entries; the least recently used entry is
+    evicted first, and expired entries are dropped lazily via an expiry heap.
+    All operations are guarded by a lock since the cache is shared between the
+    socket handlers, background image jobs and the health endpoint.
     """
     
-    def __init__(self, default_expiry: int = 3600):
+    def __init__(self, default_expiry: int = 3600, max_size: int = 1000):
         """
         Initialize the cache
         
         Args:
             default_expiry: Default expiration time in seconds (1 hour default)
+            max_size: Maximum number of entries kept before LRU eviction
+                (0 or less stores nothing)
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.default_expiry = default_expiry
+        self.max_size = max_size
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.RLock()
+        
+    def _evict_expired_head(self, now: float) -> int:
+        """
+        Pop expired entries off the expiry heap and drop them from the cache
+        
+        Callers must hold the lock. Heap entries for keys that were overwritten or deleted are skipped.
+        
+        Returns:
+            Number of cache entries removed
+        """
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            if entry is not None and entry["expires_at"] < now:
+                del self.cache[key]
+                removed += 1
+                
+        # Rebuild the heap if stale entries start to dominate it
+        if len(heap) > 2 * max(self.max_size, len(self.cache)):
+            self._expiry_heap = [(entry["expires_at"], key) for key, entry in self.cache.items()]
+            heapq.heapify(self._expiry_heap)
+            
+        return removed
         
     def get(self, key: str) -> Optional[Any]:
         """
@@ -28,16 +66,21 @@ class SimpleCache:
         Returns:
             The cached value or None if not found or expired
         """
-        if key not in self.cache:
-            return None
-            
-        entry = self.cache[key]
-        if entry["expires_at"] < time.time():
-            # Entry has expired, remove it
-            del self.cache[key]
-            return None
+        now = time.time()
+        with self._lock:
+            self._evict_expired_head(now)
             
-        return entry["value"]
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+                
+            if entry["expires_at"] < now:
+                # Entry has expired, remove it
+                self.cache.pop(key, None)
+                return None
+                
+            self.cache.move_to_end(key)
+            return entry["value"]
         
     def set(self, key: str, value: Any, expiry: Optional[int] = None) -> None:
         """
@@ -48,20 +91,42 @@ class SimpleCache:
             value: The value to cache
             expiry: Expiration time in seconds (uses default if None)
         """
-        expires_at = time.time() + (expiry if expiry is not None else self.default_expiry)
-        self.cache[key] = {
-            "value": value,
-            "expires_at": expires_at
-        }
+        if self.max_size <= 0:
+            # A cache sized to nothing keeps no entries
+            return
+            
+        now = time.time()
+        expires_at = now + (expiry if expiry is not None else self.default_expiry)
+        with self._lock:
+            self._evict_expired_head(now)
+            
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                # Evict the least recently used entry
+                self.cache.popitem(last=False)
+                
+            self.cache[key] = {
+                "value": value,
+                "expires_at": expires_at
+            }
+            heapq.heappush(self._expiry_heap, (expires_at, key))
         
     def delete(self, key: str) -> None:
         """Delete a key from the cache if it exists"""
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            self.cache.pop(key, None)
             
     def clear(self) -> None:
         """Clear the entire cache"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+            self._expiry_heap.clear()
+        
+    def size(self) -> int:
+        """Return the number of entries currently in the cache"""
+        with self._lock:
+            return len(self.cache)
         
     def clean_expired(self) -> int:
         """
@@ -70,27 +135,23 @@ class SimpleCache:
         Returns:
             Number of entries removed
         """
-        now = time.time()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if entry["expires_at"] < now
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
-            
-        return len(expired_keys)
+        with self._lock:
+            return self._evict_expired_head(time.time())
         
     def create_key(self, *args, **kwargs) -> str:
         """
         Create a cache key from arguments
         
-        This helps create consistent keys for the same inputs
+        This helps create consistent keys for the same inputs. The arguments are
+        hashed into a fixed-width digest so long prompt fields do not bloat the
+        key; the first positional argument is kept as a readable namespace.
         """
-        # Simple key creation by concatenating string values
+        # Build a canonical string from all arguments, then digest it
         key_parts = [str(arg) for arg in args]
         key_parts.extend([f"{k}={v}" for k, v in sorted(kwargs.items())])
-        return ":".join(key_parts)
+        canonical = ":".join(key_parts)
+        digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{args[0]}:{digest}" if args else digest
         
 # Global cache instance
 cache = SimpleCache() 
\ No newline at end of file
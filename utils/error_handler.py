@@ -1,6 +1,9 @@
+import re
+import sys
 import logging
 import traceback
-from typing import Dict, Any, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Any, Tuple, Optional, List, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +15,136 @@ class APIError(Exception):
         self.details = details or {}
         super().__init__(self.message)
 
-def handle_openai_error(e: Exception) -> Tuple[str, Dict[str, Any]]:
+class ErrorDetails(NamedTuple):
+    """Details of a classified OpenAI error"""
+    original_error: str
+    error_type_name: str
+    error_type: str
+
+# Error categories: error_type -> (user-facing message, log level, log prefix)
+_ERROR_CATEGORIES = {
+    "connection_error": (
+        "Could not connect to the OpenAI API. Please check your internet connection.",
+        logging.ERROR, "OpenAI API connection error"
+    ),
+    "rate_limit": (
+        "API rate limit exceeded. Please try again in a few minutes.",
+        logging.WARNING, "Rate limit error"
+    ),
+    "authentication": (
+        "Authentication error. Please check your OpenAI API key.",
+        logging.ERROR, "Authentication error"
+    ),
+    "quota_exceeded": (
+        "Your OpenAI API quota has been exceeded. Please check your billing details.",
+        logging.ERROR, "Quota exceeded error"
+    ),
+    "invalid_request": (
+        "Invalid request. Please check your inputs and try again.",
+        logging.WARNING, "Invalid request error"
+    ),
+    "model_error": (
+        "The requested AI model is currently unavailable.",
+        logging.ERROR, "Model error"
+    ),
+    "content_filter": (
+        "Your request was flagged by content filters. Please modify your content and try again.",
+        logging.WARNING, "Content filter error"
+    ),
+    "timeout": (
+        "The request timed out. Please try again with simpler inputs.",
+        logging.WARNING, "Timeout error"
+    ),
+}
+
+# OpenAI SDK exception class names (v0.x and v1.x) that identify the category
+# on their own, checked before the message is inspected. Subclasses are listed
+# before their bases (APITimeoutError derives from APIConnectionError in v1.x).
+_TYPE_MAP = {
+    "APITimeoutError": "timeout",
+    "Timeout": "timeout",
+    "APIConnectionError": "connection_error",
+    "AuthenticationError": "authentication",
+    "NotFoundError": "model_error",
+}
+
+# Coarser exception classes, only used when the message does not say more
+# (e.g. RateLimitError also covers exhausted quotas)
+_TYPE_FALLBACK_MAP = {
+    "RateLimitError": "rate_limit",
+    "InvalidRequestError": "invalid_request",
+    "BadRequestError": "invalid_request",
+}
+
+# Message keywords per category, in priority order. Matched case-insensitively
+# against the original message, so no lowercased copy is needed.
+_MESSAGE_PATTERN = re.compile(
+    r"(?P<connection_error>connection)"
+    r"|(?P<rate_limit>rate[_ ]?limit|too many requests)"
+    r"|(?P<authentication>auth|invalid api key)"
+    r"|(?P<quota_exceeded>quota|billing)"
+    r"|(?P<invalid_request>invalid[_ ]request|bad request|validation)"
+    r"|(?P<content_filter>content[_ ]filter|policy|safety)"
+    r"|(?P<timeout>timeout|timed? out)",
+    re.IGNORECASE
+)
+_MESSAGE_RANK = {name: rank for rank, name in enumerate(_MESSAGE_PATTERN.groupindex)}
+
+def _classify_message(error_str: str) -> Optional[str]:
+    """Return the highest-priority category whose keywords appear in the message"""
+    best = None
+    for match in _MESSAGE_PATTERN.finditer(error_str):
+        rank = _MESSAGE_RANK[match.lastgroup]
+        if rank == 0:
+            # Nothing outranks the first category, stop scanning
+            return match.lastgroup
+        if best is None or rank < _MESSAGE_RANK[best]:
+            best = match.lastgroup
+    return best
+
+def _sdk_exception_classes(names: Dict[str, str]) -> List[Tuple[type, str]]:
+    """
+    Resolve OpenAI SDK exception class names to classes of the loaded SDK
+    
+    The SDK is looked up in sys.modules rather than imported: an exception can
+    only be an SDK exception once something has loaded the SDK.
+    
+    Returns:
+        List of (exception class, category) pairs in the order of names
+    """
+    modules = [sys.modules.get("openai"), sys.modules.get("openai.error")]
+    resolved = []
+    for name, category in names.items():
+        for module in modules:
+            exc_cls = getattr(module, name, None)
+            if isinstance(exc_cls, type):
+                resolved.append((exc_cls, category))
+                break
+    return resolved
+
+@lru_cache(maxsize=128)
+def _classify_exc_class(cls: type) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve the categories implied by an exception class
+    
+    Uses subclass checks against the SDK's own exception classes, so unrelated
+    exceptions that happen to share a name are not misclassified. The result
+    depends only on the class, so it is memoized.
+    
+    Returns:
+        Tuple of (category from _TYPE_MAP, category from _TYPE_FALLBACK_MAP)
+    """
+    category = next(
+        (category for exc_cls, category in _sdk_exception_classes(_TYPE_MAP) if issubclass(cls, exc_cls)),
+        None
+    )
+    fallback = next(
+        (category for exc_cls, category in _sdk_exception_classes(_TYPE_FALLBACK_MAP) if issubclass(cls, exc_cls)),
+        None
+    )
+    return category, fallback
+
+def handle_openai_error(e: Exception) -> Tuple[str, ErrorDetails]:
     """
     Handle OpenAI API errors with user-friendly messages
     
@@ -21,62 +153,40 @@ def handle_openai_error(e: Exception) -> Tuple[str, Dict[str, Any]]:
         
     Returns:
         Tuple containing user-friendly error message and error details
+        (use ErrorDetails._asdict() when the details are sent to the client)
     """
-    # Convert exception to string
-    error_str = str(e).lower()
+    # Stringify once; the message is only scanned if the class says nothing
+    error_str = str(e)
     # Get error type name if available
     error_type = type(e).__name__
     
-    error_details = {
-        "original_error": str(e),
-        "error_type_name": error_type
-    }
+    category, fallback = _classify_exc_class(type(e))
+    if category is None:
+        category = _classify_message(error_str) or fallback
     
-    # Check for newer API error types first (OpenAI v1.x)
-    if "apiconnectionerror" in error_type:
-        message = "Could not connect to the OpenAI API. Please check your internet connection."
-        error_details["error_type"] = "connection_error"
-        logger.error(f"OpenAI API connection error: {e}")
-    elif "apiconnectionerror" in error_type or "connection" in error_str:
-        message = "Could not connect to the OpenAI API. Please check your internet connection."
-        error_details["error_type"] = "connection_error"
-        logger.error(f"OpenAI API connection error: {e}")
-    elif "ratecreaterequesterror" in error_type or "rate_limit" in error_str or "rate limit" in error_str or "too many requests" in error_str:
-        message = "API rate limit exceeded. Please try again in a few minutes."
-        error_details["error_type"] = "rate_limit"
-        logger.warning(f"Rate limit error: {e}")
-    elif "authenticationerror" in error_type or "authentication" in error_str or "auth" in error_str or "unauthorized" in error_str or "invalid api key" in error_str:
-        message = "Authentication error. Please check your OpenAI API key."
-        error_details["error_type"] = "authentication"
-        logger.error(f"Authentication error: {e}")
-    elif "insufficientquota" in error_type or "quota" in error_str or "billing" in error_str:
-        message = "Your OpenAI API quota has been exceeded. Please check your billing details."
-        error_details["error_type"] = "quota_exceeded"
-        logger.error(f"Quota exceeded error: {e}")
-    elif "invalidrequesterror" in error_type or "invalid_request" in error_str or "bad request" in error_str or "validation" in error_str:
-        message = "Invalid request. Please check your inputs and try again."
-        error_details["error_type"] = "invalid_request"
-        logger.warning(f"Invalid request error: {e}")
-    elif "apierror" in error_type and ("model" in error_str or "not found" in error_str or "unavailable" in error_str):
-        message = "The requested AI model is currently unavailable."
-        error_details["error_type"] = "model_error"
-        logger.error(f"Model error: {e}")
-    elif "contentfilterror" in error_type or "content_filter" in error_str or "content filter" in error_str or "policy" in error_str or "safety" in error_str:
-        message = "Your request was flagged by content filters. Please modify your content and try again."
-        error_details["error_type"] = "content_filter"
-        logger.warning(f"Content filter error: {e}")
-    elif "timeout" in error_str or "timed out" in error_str:
-        message = "The request timed out. Please try again with simpler inputs."
-        error_details["error_type"] = "timeout"
-        logger.warning(f"Timeout error: {e}")
     # Generic error fallback
-    else:
-        message = "An error occurred with the AI service. Please try again later."
-        error_details["error_type"] = "unknown"
-        logger.error(f"Unexpected OpenAI error: {e}\n{traceback.format_exc()}")
+    if category is None:
+        # Only walk the stack when the record will actually be written
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Unexpected OpenAI error: %s\n%s", error_str, traceback.format_exc())
+        error_details = ErrorDetails(error_str, error_type, "unknown")
+        return "An error occurred with the AI service. Please try again later.", error_details
+    
+    message, level, log_prefix = _ERROR_CATEGORIES[category]
+    error_details = ErrorDetails(error_str, error_type, category)
+    logger.log(level, "%s: %s", log_prefix, error_str)
     
     return message, error_details
 
+# log_error levels per error type; unknown types are logged at INFO
+_ERROR_LOG_TYPES = frozenset({"authentication", "server", "critical"})
+_WARNING_LOG_TYPES = frozenset({"rate_limit", "timeout", "invalid_request"})
+_ERROR_LEVELS = {
+    **dict.fromkeys(_ERROR_LOG_TYPES, (logging.ERROR, "ERROR")),
+    **dict.fromkeys(_WARNING_LOG_TYPES, (logging.WARNING, "WARNING")),
+}
+_DEFAULT_ERROR_LEVEL = (logging.INFO, "INFO")
+
 def log_error(error_type: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
     """
     Log an error with consistent formatting
@@ -86,12 +196,9 @@ def log_error(error_type: str, message: str, details: Optional[Dict[str, Any]] =
         message: The error message
         details: Additional error details
     """
-    details = details or {}
-    
     # Log with appropriate level based on error type
-    if error_type in ["authentication", "server", "critical"]:
-        logger.error(f"{error_type.upper()} ERROR: {message} | Details: {details}")
-    elif error_type in ["rate_limit", "timeout", "invalid_request"]:
-        logger.warning(f"{error_type.upper()} WARNING: {message} | Details: {details}")
-    else:
-        logger.info(f"{error_type.upper()} INFO: {message} | Details: {details}") 
\ No newline at end of file
+    level, tag = _ERROR_LEVELS.get(error_type, _DEFAULT_ERROR_LEVEL)
+    if not logger.isEnabledFor(level):
+        return
+        
+    logger.log(level, "%s %s: %s | Details: %s", error_type.upper(), tag, message, details or {})
\ No newline at end of file
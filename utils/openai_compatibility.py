@@ -17,8 +17,14 @@ try:
     if IS_NEW_API:
         logger.info("Using new OpenAI client API (v1.x)")
         # Create the client with the API key from environment
-        from openai import OpenAI
+        from openai import OpenAI, AsyncOpenAI
         client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Bind the endpoints once instead of walking the client namespaces per call
+        _chat_create = client.chat.completions.create
+        _image_generate = client.images.generate
+        _achat_create = async_client.chat.completions.create
+        _aimage_generate = async_client.images.generate
     else:
         logger.info("Using legacy OpenAI API (v0.x)")
         # For legacy API, just set the API key
@@ -29,121 +35,208 @@ except ImportError:
     OPENAI_AVAILABLE = False
     IS_NEW_API = False
 
-def create_chat_completion(
+def _create_chat_completion_new(
     model: str,
     messages: List[Dict[str, str]],
     max_tokens: int = 600,
     temperature: float = 0.7,
     stream: bool = False
 ) -> Any:
-    """
-    Compatibility wrapper for OpenAI chat completion API
-    
-    Works with both old-style and new client-based API
-    """
-    try:
-        if not OPENAI_AVAILABLE:
-            raise Exception("OpenAI package is not installed")
-            
-        if IS_NEW_API:
-            # Use the new client-based API
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                stream=stream
-            )
-            return response
-        else:
-            # Use the old-style API
-            return openai.ChatCompletion.create(
-                model=model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                stream=stream
-            )
-    except Exception as e:
-        logger.error(f"Error creating chat completion: {str(e)}")
-        raise
-
-def create_image(
+    """Chat completion through the new client-based API (v1.x)"""
+    return _chat_create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=stream
+    )
+
+def _create_chat_completion_legacy(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int = 600,
+    temperature: float = 0.7,
+    stream: bool = False
+) -> Any:
+    """Chat completion through the old-style API (v0.x)"""
+    return openai.ChatCompletion.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=stream
+    )
+
+async def _acreate_chat_completion_new(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int = 600,
+    temperature: float = 0.7,
+    stream: bool = False
+) -> Any:
+    """Chat completion through the new client-based async API (v1.x)"""
+    return await _achat_create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=stream
+    )
+
+async def _acreate_chat_completion_legacy(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int = 600,
+    temperature: float = 0.7,
+    stream: bool = False
+) -> Any:
+    """Chat completion through the old-style async API (v0.x, aiohttp based)"""
+    return await openai.ChatCompletion.acreate(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=stream
+    )
+
+def _create_image_new(
     prompt: str,
     n: int = 1,
     size: str = "1024x1024",
     model: str = "dall-e-3",
     quality: str = "standard"
 ) -> Any:
-    """
-    Compatibility wrapper for OpenAI image generation API
-    
-    Works with both old-style and new client-based API
-    """
-    try:
-        if not OPENAI_AVAILABLE:
-            raise Exception("OpenAI package is not installed")
-            
-        if IS_NEW_API:
-            # Use the new client-based API
-            response = client.images.generate(
-                model=model,
-                prompt=prompt,
-                n=n,
-                size=size,
-                quality=quality
-            )
-            return response
-        else:
-            # Use the old-style API
-            return openai.Image.create(
-                prompt=prompt,
-                n=n,
-                size=size,
-                model=model,
-                quality=quality
-            )
-    except Exception as e:
-        logger.error(f"Error creating image: {str(e)}")
-        raise
-
-def get_completion_text(response: Any, stream: bool = False) -> str:
-    """
-    Extract text from completion response
-    
-    Works with both old-style and new client-based API response objects
-    """
+    """Image generation through the new client-based API (v1.x)"""
+    return _image_generate(
+        model=model,
+        prompt=prompt,
+        n=n,
+        size=size,
+        quality=quality
+    )
+
+def _create_image_legacy(
+    prompt: str,
+    n: int = 1,
+    size: str = "1024x1024",
+    model: str = "dall-e-3",
+    quality: str = "standard"
+) -> Any:
+    """Image generation through the old-style API (v0.x)"""
+    return openai.Image.create(
+        prompt=prompt,
+        n=n,
+        size=size,
+        model=model,
+        quality=quality
+    )
+
+async def _acreate_image_new(
+    prompt: str,
+    n: int = 1,
+    size: str = "1024x1024",
+    model: str = "dall-e-3",
+    quality: str = "standard"
+) -> Any:
+    """Image generation through the new client-based async API (v1.x)"""
+    return await _aimage_generate(
+        model=model,
+        prompt=prompt,
+        n=n,
+        size=size,
+        quality=quality
+    )
+
+async def _acreate_image_legacy(
+    prompt: str,
+    n: int = 1,
+    size: str = "1024x1024",
+    model: str = "dall-e-3",
+    quality: str = "standard"
+) -> Any:
+    """Image generation through the old-style async API (v0.x, aiohttp based)"""
+    return await openai.Image.acreate(
+        prompt=prompt,
+        n=n,
+        size=size,
+        model=model,
+        quality=quality
+    )
+
+def _openai_unavailable(*args: Any, **kwargs: Any) -> Any:
+    """Stand-in for the API calls when the OpenAI package is missing"""
+    raise RuntimeError("OpenAI package is not installed")
+
+async def _aopenai_unavailable(*args: Any, **kwargs: Any) -> Any:
+    """Stand-in for the async API calls when the OpenAI package is missing"""
+    raise RuntimeError("OpenAI package is not installed")
+
+def _get_completion_text_new(response: Any, stream: bool = False) -> str:
+    """Extract text from a v1.x completion response"""
     if not stream:
-        if IS_NEW_API:
-            return response.choices[0].message.content
-        else:
-            return response.choices[0].message['content']
+        return response.choices[0].message.content
     return ""  # For streaming, handled separately
 
-def get_image_url(response: Any) -> str:
-    """
-    Extract image URL from image response
-    
-    Works with both old-style and new client-based API response objects
-    """
-    if IS_NEW_API:
-        return response.data[0].url
-    else:
-        return response['data'][0]['url']
+def _get_completion_text_legacy(response: Any, stream: bool = False) -> str:
+    """Extract text from a v0.x completion response"""
+    if not stream:
+        return response.choices[0].message['content']
+    return ""  # For streaming, handled separately
 
-def extract_stream_content(chunk: Any) -> Optional[str]:
-    """
-    Extract content from streaming response chunk
-    
-    Works with both old-style and new client-based API streaming formats
-    """
+def _get_image_url_new(response: Any) -> str:
+    """Extract the image URL from a v1.x image response"""
+    return response.data[0].url
+
+def _get_image_url_legacy(response: Any) -> str:
+    """Extract the image URL from a v0.x image response"""
+    return response['data'][0]['url']
+
+def _extract_stream_content_new(chunk: Any) -> Optional[str]:
+    """Extract content from a v1.x streaming chunk"""
+    try:
+        return getattr(chunk.choices[0].delta, 'content', "") or ""
+    except (AttributeError, IndexError, KeyError) as e:
+        logger.warning(f"Error extracting stream content: {str(e)}")
+        return ""
+
+def _extract_stream_content_legacy(chunk: Any) -> Optional[str]:
+    """Extract content from a v0.x streaming chunk"""
     try:
-        if IS_NEW_API:
-            if hasattr(chunk.choices[0].delta, 'content'):
-                return chunk.choices[0].delta.content or ""
-            return ""
-        else:
-            return chunk.choices[0].get('delta', {}).get('content', '')
+        return chunk.choices[0].get('delta', {}).get('content', '')
     except (AttributeError, IndexError, KeyError) as e:
         logger.warning(f"Error extracting stream content: {str(e)}")
-        return "" 
\ No newline at end of file
+        return ""
+
+# Public compatibility API. IS_NEW_API and OPENAI_AVAILABLE are fixed at import
+# time, so each name is bound straight to the implementation for the installed
+# SDK version instead of branching on every call. All of them work the same
+# with either SDK:
+#   create_chat_completion(model, messages, max_tokens, temperature, stream)
+#   create_image(prompt, n, size, model, quality)
+#   acreate_chat_completion(...) / acreate_image(...): awaitable versions of the
+#       above; a streamed completion is iterated with async for
+#   get_completion_text(response, stream) -> str
+#   get_image_url(response) -> str
+#   extract_stream_content(chunk) -> Optional[str]
+if IS_NEW_API:
+    create_chat_completion = _create_chat_completion_new
+    create_image = _create_image_new
+    acreate_chat_completion = _acreate_chat_completion_new
+    acreate_image = _acreate_image_new
+    get_completion_text = _get_completion_text_new
+    get_image_url = _get_image_url_new
+    extract_stream_content = _extract_stream_content_new
+else:
+    create_chat_completion = _create_chat_completion_legacy
+    create_image = _create_image_legacy
+    acreate_chat_completion = _acreate_chat_completion_legacy
+    acreate_image = _acreate_image_legacy
+    get_completion_text = _get_completion_text_legacy
+    get_image_url = _get_image_url_legacy
+    extract_stream_content = _extract_stream_content_legacy
+
+if not OPENAI_AVAILABLE:
+    create_chat_completion = _openai_unavailable
+    create_image = _openai_unavailable
+    acreate_chat_completion = _aopenai_unavailable
+    acreate_image = _aopenai_unavailable
\ No newline at end of file
@@ -1,79 +1,185 @@
 import re
+import functools
 from typing import Tuple, Dict, Any
 
+# Precompiled sanitization pattern for role prefixes and "ignore previous
+# instructions". ASCII text is matched case-sensitively against a lowercased
+# copy, so the regex engine does not case-fold every character it compares;
+# other text keeps the IGNORECASE pattern, which also folds characters such as
+# the long s that lower() leaves alone.
+_SCRUB_PATTERN = r'system:|user:|assistant:|ignore previous instructions'
+_SCRUB_RE = re.compile(_SCRUB_PATTERN)
+_SCRUB_IGNORECASE_RE = re.compile(_SCRUB_PATTERN, re.IGNORECASE)
+
+_CODE_FENCE = "```"
+
+# Scrub rounds per input: the second round catches a match formed by joining
+# the pieces around a removed one, and the cap keeps nested input linear
+_MAX_SCRUB_PASSES = 3
+
+def _strip_code_blocks(text: str) -> Tuple[str, int]:
+    """
+    Remove ```fenced``` spans with a linear str.find scan
+    
+    Pairs fences left to right like a non-greedy regex would; an unmatched
+    opening fence and everything after it are kept.
+    
+    Returns:
+        Tuple[str, int]: (stripped_text, number_of_blocks_removed)
+    """
+    parts = []
+    pos = 0
+    while True:
+        start = text.find(_CODE_FENCE, pos)
+        if start < 0:
+            break
+        end = text.find(_CODE_FENCE, start + 3)
+        if end < 0:
+            break
+        parts.append(text[pos:start])
+        pos = end + 3
+    if not parts:
+        return text, 0
+    parts.append(text[pos:])
+    return "".join(parts), len(parts) - 1
+
+def _scrub_once(text: str) -> Tuple[str, int]:
+    """
+    Remove one round of code blocks and scrub matches from text
+    
+    Returns:
+        Tuple[str, int]: (scrubbed_text, number_of_matches_removed)
+    """
+    text, blocks = _strip_code_blocks(text)
+    
+    if not text.isascii():
+        # lower() does not fold everything IGNORECASE does, so use the regex
+        text, removed = _SCRUB_IGNORECASE_RE.subn('', text)
+        return text, blocks + removed
+        
+    parts = []
+    pos = 0
+    for match in _SCRUB_RE.finditer(text.lower()):
+        parts.append(text[pos:match.start()])
+        pos = match.end()
+    if not parts:
+        return text, blocks
+    parts.append(text[pos:])
+    return "".join(parts), blocks + len(parts) - 1
+
 def sanitize_prompt_input(text: str) -> str:
     """
     Sanitize user input to prevent prompt injection attacks
     
     This function removes control characters, markdown code blocks,
-    and attempts to override system/user role prompts
+    and attempts to override system/user role prompts. Results for
+    short inputs are memoized since the same fields are sanitized repeatedly.
     """
     if not text:
         return ""
-        
-    # Remove any markdown code block syntax
-    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    if not isinstance(text, str):
+        text = str(text)
+    if len(text) > _SANITIZE_CACHE_MAX_LEN:
+        return _sanitize(text)
+    return _sanitize_cached(text)
+
+def _sanitize(text: str) -> str:
+    """Pure sanitization pass behind sanitize_prompt_input"""
+    # Fast path: in ASCII text every scrub pattern needs a backtick, a colon or
+    # "ignore"; non-ASCII text can case-fold into "ignore" and takes the full pass
+    if text.isascii() and '`' not in text and ':' not in text and 'ignore' not in text.lower():
+        return ' '.join(text.split())
     
-    # Remove any attempt to use system/user role prompts
-    text = re.sub(r'(system:|user:|assistant:)', '', text, flags=re.IGNORECASE)
+    # Remove code blocks, role prompts and instruction overrides; repeat a few
+    # times while anything was removed, since a removal can join a new match
+    for _ in range(_MAX_SCRUB_PASSES):
+        text, removed = _scrub_once(text)
+        if not removed:
+            break
     
-    # Remove any instructions to ignore previous instructions
-    text = re.sub(r'ignore previous instructions', '', text, flags=re.IGNORECASE)
+    # Remove excessive whitespace (split() collapses runs and strips the ends)
+    return ' '.join(text.split())
+
+# Only inputs up to this length are memoized, so client-supplied strings
+# cannot fill the cache with arbitrarily large keys and values
+_SANITIZE_CACHE_MAX_LEN = 1000
+_sanitize_cached = functools.lru_cache(maxsize=1024)(_sanitize)
+
+# Form field rules: (field, max_length, required, display_name)
+_PRODUCT_NAME = ("product_name", 100, True, "Product name")
+_PRODUCT_DETAILS = ("product_details", 1000, False, "Product details")
+_KEYWORDS = ("keywords", 200, False, "Keywords")
+_EXTRA_INSTRUCTIONS = ("extra_instructions", 500, False, "Extra instructions")
+
+# Every form field in validation order; required fields come first so a
+# fast-failing check stops before looking at the optional ones
+_FORM_FIELDS: Tuple[Tuple[str, int, bool, str], ...] = (
+    _PRODUCT_NAME,
+    _PRODUCT_DETAILS,
+    _KEYWORDS,
+    _EXTRA_INSTRUCTIONS,
+)
+
+def _check_fields(
+    rules: Tuple[Tuple[str, int, bool, str], ...],
+    data: Dict[str, Any],
+    fail_fast: bool = False
+) -> Dict[str, str]:
+    """
+    Check data against the given field rules
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    With fail_fast, the first invalid required field ends the check.
     
-    return text
+    Returns:
+        Dict[str, str]: error message per invalid field
+    """
+    errors = {}
+    for field, limit, required, label in rules:
+        value = data.get(field, "")
+        if required:
+            if not value or not value.strip():
+                errors[field] = f"{label} is required"
+            elif len(value) > limit:
+                errors[field] = f"{label} must be under {limit} characters"
+            if fail_fast and errors:
+                return errors
+        elif value and len(value) > limit:
+            # Optional fields are only checked when provided
+            errors[field] = f"{label} must be under {limit} characters"
+    return errors
+
+def _validate_field(rule: Tuple[str, int, bool, str], value: str) -> Tuple[bool, str]:
+    """Check one value through _check_fields in the (is_valid, message) shape"""
+    field = rule[0]
+    message = _check_fields((rule,), {field: value}).get(field)
+    return message is None, message or ""
 
 def validate_product_name(name: str) -> Tuple[bool, str]:
     """Validate the product name"""
-    if not name or not name.strip():
-        return False, "Product name is required"
-    if len(name) > 100:
-        return False, "Product name must be under 100 characters"
-    return True, ""
+    return _validate_field(_PRODUCT_NAME, name)
 
 def validate_product_details(details: str) -> Tuple[bool, str]:
     """Validate the product details"""
-    if len(details) > 1000:
-        return False, "Product details must be under 1000 characters"
-    return True, ""
+    return _validate_field(_PRODUCT_DETAILS, details)
 
 def validate_keywords(keywords: str) -> Tuple[bool, str]:
     """Validate the SEO keywords"""
-    if len(keywords) > 200:
-        return False, "Keywords must be under 200 characters"
-    return True, ""
+    return _validate_field(_KEYWORDS, keywords)
 
 def validate_extra_instructions(instructions: str) -> Tuple[bool, str]:
     """Validate the extra instructions"""
-    if len(instructions) > 500:
-        return False, "Extra instructions must be under 500 characters"
-    return True, ""
+    return _validate_field(_EXTRA_INSTRUCTIONS, instructions)
 
-def validate_form_data(data: Dict[str, Any]) -> Tuple[bool, Dict[str, str]]:
+def validate_form_data(data: Dict[str, Any], report_all: bool = False) -> Tuple[bool, Dict[str, str]]:
     """
     Validate all form data
     
+    A submission whose product name is missing or too long fails immediately
+    with that single error, unless report_all is set to also check the
+    remaining fields.
+    
     Returns:
         Tuple[bool, Dict[str, str]]: (is_valid, error_messages)
     """
-    errors = {}
-    
-    # Validate product name (required)
-    valid, message = validate_product_name(data.get("product_name", ""))
-    if not valid:
-        errors["product_name"] = message
-        
-    # Validate other fields (optional)
-    for field, validator in [
-        ("product_details", validate_product_details),
-        ("keywords", validate_keywords),
-        ("extra_instructions", validate_extra_instructions)
-    ]:
-        if field in data and data[field]:
-            valid, message = validator(data.get(field, ""))
-            if not valid:
-                errors[field] = message
-                
-    return len(errors) == 0, errors 
\ No newline at end of file
+    errors = _check_fields(_FORM_FIELDS, data or {}, fail_fast=not report_all)
+    return len(errors) == 0, errors
@@ -0,0 +1,239 @@
+"""
+Flask application and request handling shared by the server entry points
+
+app.py serves this app through Flask-SocketIO on eventlet, asgi_app.py through
+python-socketio's AsyncServer. No Socket.IO server is built here, so importing
+this module does not commit the process to either async mode.
+"""
+import os
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+from flask import Flask, Response, render_template, jsonify
+from config import AppConfig
+from utils.validation import validate_form_data, sanitize_prompt_input
+from utils.cache import cache
+from utils.ai_service import get_usage_stats, configure_workers
+
+# Set up logging
+logging.basicConfig(level=getattr(logging, AppConfig.LOG_LEVEL))
+logger = logging.getLogger(__name__)
+
+# Apply cache settings from config
+cache.default_expiry = AppConfig.CACHE_DEFAULT_TIMEOUT
+cache.max_size = AppConfig.CACHE_MAX_SIZE
+
+# Size the worker pools for blocking OpenAI calls from config
+configure_workers(AppConfig.AI_MAX_WORKERS, AppConfig.IMAGE_MAX_WORKERS)
+
+# Create Flask app
+app = Flask(__name__)
+app.config['SECRET_KEY'] = AppConfig.SECRET_KEY
+
+# Socket.IO settings used by both entry points
+SOCKETIO_OPTIONS: Dict[str, Any] = {
+    "cors_allowed_origins": "*",         # Allow all origins (string instead of list)
+    "logger": AppConfig.DEBUG,           # Per-frame logging only in debug mode
+    "engineio_logger": AppConfig.DEBUG,
+    "ping_timeout": 60,                  # Standard ping timeout
+    "ping_interval": 25,                 # Standard ping interval
+    "allow_upgrades": True,              # Allow transport upgrades
+    "cookie": False                      # No cookies for session management
+}
+
+# Check if API key exists
+if not os.getenv("OPENAI_API_KEY"):
+    logger.warning("OPENAI_API_KEY not found in .env or environment variables.")
+    # Set a dummy key to prevent initialization errors
+    os.environ["OPENAI_API_KEY"] = "dummy_key_please_set_in_env"
+
+# Resolve once whether a real API key is configured
+API_KEY_CONFIGURED = os.getenv("OPENAI_API_KEY") != "dummy_key_please_set_in_env"
+
+# Error messages shared by the socket handlers
+NO_API_KEY_MESSAGE = "Error: OpenAI API key is not configured. Please check server configuration."
+UNEXPECTED_ERROR_MESSAGE = "Error: An unexpected error occurred. Please try again."
+
+# Fixed updates sent by the socket handlers
+CONNECTED_STATUS = {
+    "status": "connected",
+    "message": "Connected to server"
+}
+
+IMAGE_STARTED_UPDATE = {
+    "data": "Starting image generation in parallel...",
+    "partial": "",
+    "percent": 0,
+    "image_generation_started": True
+}
+
+def error_payload(event: str, message: str, **extra: Any) -> Dict[str, Any]:
+    """
+    Build an error update in the payload shape the client expects for an event
+
+    "image_progress" updates carry the message in "status", "progress" updates
+    carry it in "data" alongside an empty "partial". Extra fields are merged in.
+    """
+    if event == "image_progress":
+        payload = {"status": message, "percent": 0, "error": True}
+    else:
+        payload = {"data": message, "partial": "", "percent": 0, "error": True}
+    payload.update(extra)
+    return payload
+
+def image_pending_update(completed_text: str) -> Dict[str, Any]:
+    """Build the update telling the client the image is still on its way"""
+    return {
+        "data": "Text generation complete, image generation in progress.",
+        "partial": completed_text,
+        "percent": 100
+    }
+
+def prepare_generation(sid: str, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str, bool]:
+    """
+    Check a start_generation request and extract what the handlers need
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], str, bool]: (error_update, product_name, image_toggle);
+        error_update is a ready "progress" payload when the request cannot proceed
+    """
+    logger.info(f"Received generation request from client {sid}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Generation request data: {data}")
+
+    # Check if API key is properly configured
+    if not API_KEY_CONFIGURED:
+        logger.error("OpenAI API key is not properly configured")
+        return error_payload("progress", NO_API_KEY_MESSAGE), "", False
+
+    # Validate the data
+    is_valid, errors = validate_form_data(data)
+    if not is_valid:
+        logger.warning(f"Validation failed: {errors}")
+        return error_payload("progress", f"Error: {'; '.join(errors.values())}", errors=errors), "", False
+
+    # Extract and sanitize fields from data
+    product_name = sanitize_prompt_input(data.get("product_name", "")).strip()
+    logger.info(f"Generating description for: {product_name}")
+
+    # Fixed: Changed from image_toggle to generate_image to match client
+    image_toggle = data.get("generate_image", False)
+
+    # Check if image generation is disabled in config but requested
+    if image_toggle and not AppConfig.ENABLE_IMAGE_GENERATION:
+        logger.warning("Image generation was requested but is disabled in config")
+        image_toggle = False
+
+    return None, product_name, image_toggle
+
+def prepare_image_regeneration(sid: str, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Check a regenerate_image request and extract the product name
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], str]: (error_update, product_name);
+        error_update is a ready "image_progress" payload when the request cannot proceed
+    """
+    logger.info(f"Received image regeneration request from client {sid}")
+
+    # Check if API key is properly configured
+    if not API_KEY_CONFIGURED:
+        logger.error("OpenAI API key is not configured")
+        return error_payload("image_progress", NO_API_KEY_MESSAGE), ""
+
+    # Extract product name
+    product_name = sanitize_prompt_input(data.get("product_name", "")).strip()
+    if not product_name:
+        return error_payload("image_progress", "Error: Product name is required"), ""
+
+    logger.info(f"Regenerating image for: {product_name}")
+    return None, product_name
+
+def log_startup() -> None:
+    """Clean the cache and log the configuration before a server starts"""
+    # Clean expired cache items before starting
+    expired_items = cache.clean_expired()
+    if expired_items > 0:
+        logger.info(f"Cleaned {expired_items} expired items from cache")
+
+    # Validate OpenAI API key
+    if not API_KEY_CONFIGURED:
+        logger.warning("\n" + "="*80)
+        logger.warning("WARNING: No valid OpenAI API key found!")
+        logger.warning("The application will start, but AI generation will not work.")
+        logger.warning("Please set your OPENAI_API_KEY in the .env file.")
+        logger.warning("="*80 + "\n")
+    else:
+        logger.info("OpenAI API key configured")
+
+    # Log configuration
+    logger.info(f"Starting server on {AppConfig.HOST}:{AppConfig.PORT}")
+    logger.info(f"Debug mode: {AppConfig.DEBUG}")
+    logger.info(f"Image generation: {'enabled' if AppConfig.ENABLE_IMAGE_GENERATION else 'disabled'}")
+    logger.info(f"Caching: {'enabled' if AppConfig.ENABLE_CACHING else 'disabled'}")
+
+# Rendered static templates, keyed by template name and context
+_TEMPLATE_CACHE: Dict[tuple, str] = {}
+
+def render_cached(template: str, **context: Any) -> str:
+    """
+    Render a template once and serve the stored HTML afterwards
+
+    Only used for templates whose output depends solely on the given context.
+    Caching is bypassed in debug mode so template edits show up immediately.
+    """
+    key = (template, tuple(sorted(context.items())))
+    html = _TEMPLATE_CACHE.get(key)
+    if html is None or AppConfig.DEBUG:
+        html = render_template(template, **context)
+        _TEMPLATE_CACHE[key] = html
+    return html
+
+@app.route("/")
+def index():
+    """Render the main application page"""
+    try:
+        return Response(render_cached("index.html"), mimetype="text/html")
+    except Exception as e:
+        logger.error(f"Error rendering template: {str(e)}")
+        return f"Error loading page: {str(e)}", 500
+
+@app.route("/health")
+def health_check():
+    """
+    Health check endpoint for monitoring
+
+    Returns basic system status information
+    """
+    try:
+        # Get usage statistics
+        usage = get_usage_stats()
+
+        # Return health status
+        return jsonify({
+            "status": "ok",
+            "api_configured": API_KEY_CONFIGURED,
+            "cache_entries": cache.size(),
+            "usage": usage,
+            "config": {
+                "image_generation_enabled": AppConfig.ENABLE_IMAGE_GENERATION,
+                "caching_enabled": AppConfig.ENABLE_CACHING
+            }
+        })
+    except Exception as e:
+        logger.error(f"Health check error: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+@app.errorhandler(404)
+def page_not_found(e):
+    """Handle 404 errors"""
+    return render_cached('error.html', error="Page not found"), 404
+
+@app.errorhandler(500)
+def server_error(e):
+    """Handle 500 errors"""
+    logger.error(f"Server error: {str(e)}")
+    return render_cached('error.html', error="Server error"), 500